@@ -265,6 +265,12 @@ class App(blueprints.Blueprint):
             worker. Use ``False`` if you want to handle signals yourself (e.g. if you
             run the work as an async task in a bigger application)
             (defaults to ``True``)
+        parallel_sync_tasks: ``bool``
+            If ``True``, each job of a synchronous task runs in its own thread, so
+            that with ``concurrency`` above 1, several of them can run at the same
+            time. Only use this if your synchronous tasks are thread-safe. If
+            ``False``, synchronous tasks all run in a single thread, one at a time.
+            See `howto/production/concurrency` (defaults to ``False``)
         """
         self.perform_import_paths()
         worker = self._worker(**kwargs)
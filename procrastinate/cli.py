@@ -320,6 +320,16 @@ def configure_worker_parser(subparsers: argparse._SubParsersAction):
         envvar_help="use 0/n/f or 1/y/t",
         envvar_type=env_bool,
     )
+    add_argument(
+        worker_parser,
+        "--parallel-sync-tasks",
+        "--no-parallel-sync-tasks",
+        action=store_true_with_negative(),
+        help="Whether jobs of synchronous tasks may run in parallel threads",
+        envvar="WORKER_PARALLEL_SYNC_TASKS",
+        envvar_help="use 0/n/f or 1/y/t",
+        envvar_type=env_bool,
+    )
     add_argument(
         worker_parser,
         "--delete-jobs",
@@ -10,7 +10,7 @@ import psycopg2
 import psycopg2.errors
 import psycopg2.extras
 import psycopg2.sql
-from psycopg2.extras import Json, RealDictCursor
+from psycopg2.extras import Json
 
 from procrastinate import connector, exceptions, sql, utils
 from procrastinate.contrib.psycopg2 import psycopg2_connector
@@ -120,9 +120,10 @@ class AiopgConnector(connector.BaseAsyncConnector):
             Passed to aiopg. Default is False instead of True to avoid messing with
             the global state.
         cursor_factory : ``psycopg2.extensions.cursor``
-            Passed to aiopg. Default is ``psycopg2.extras.RealDictCursor``
-            instead of standard cursor. There is no identified use case for changing
-            this.
+            Passed to aiopg. Default is
+            `procrastinate.contrib.psycopg2.psycopg2_connector.DictRowCursor`,
+            returning rows as dicts, instead of standard cursor. There is no
+            identified use case for changing this.
         maxsize : ``int``
             Passed to aiopg. If value is 1, then listen/notify feature will be
             deactivated.
@@ -173,7 +174,7 @@ class AiopgConnector(connector.BaseAsyncConnector):
             "enable_hstore": False,
             "enable_uuid": False,
             "on_connect": on_connect,
-            "cursor_factory": RealDictCursor,
+            "cursor_factory": psycopg2_connector.DictRowCursor,
         }
 
         final_args.update(pool_args)
@@ -225,13 +226,15 @@ class AiopgConnector(connector.BaseAsyncConnector):
             while self._pool._free:
                 self._pool._free.popleft().close()
 
+    def _wrap_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return Json(value, dumps=self.json_dumps)
+        elif isinstance(value, list):
+            return [self._wrap_value(item) for item in value]
+        return value
+
     def _wrap_json(self, arguments: dict[str, Any]):
-        return {
-            key: Json(value, dumps=self.json_dumps)
-            if isinstance(value, dict)
-            else value
-            for key, value in arguments.items()
-        }
+        return {key: self._wrap_value(value) for key, value in arguments.items()}
 
     # Pools and single connections do not exactly share their cursor API:
     # - connection.cursor() is an async context manager (async with)
@@ -273,7 +276,11 @@ class AiopgConnector(connector.BaseAsyncConnector):
 
             return await cursor.fetchall()
 
-    def _make_dynamic_query(self, query: str, **identifiers: str) -> Any:
+    # Composing the query is pure Python work that gives the same result every
+    # time the listener (re)connects to the same channels.
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _make_dynamic_query(query: str, **identifiers: str) -> Any:
         return psycopg2.sql.SQL(query).format(
             **{
                 key: psycopg2.sql.Identifier(value)
@@ -297,12 +304,17 @@ class AiopgConnector(connector.BaseAsyncConnector):
 
         while True:
             async with self.pool.acquire() as connection:
-                for channel_name in channels:
+                # All the channels are listened to in a single round-trip
+                listen_queries = [
+                    self._make_dynamic_query(
+                        query=sql.queries["listen_queue"], channel_name=channel_name
+                    )
+                    for channel_name in channels
+                ]
+                if listen_queries:
                     await self._execute_query_connection(
                         connection=connection,
-                        query=self._make_dynamic_query(
-                            query=sql.queries["listen_queue"], channel_name=channel_name
-                        ),
+                        query=psycopg2.sql.Composed(listen_queries),
                     )
                 # Initial set() lets caller know that we're ready to listen
                 event.set()
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django.db import migrations
+
+from .. import migrations_utils
+
+
+class Migration(migrations.Migration):
+    operations = [
+        migrations_utils.RunProcrastinateSQL(
+            name="02.08.00_02_add_defer_jobs_function.sql"
+        ),
+    ]
+    name = "0030_add_defer_jobs_function"
+    dependencies = [("procrastinate", "0029_add_additional_params_to_retry_job")]
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django.db import migrations
+
+from .. import migrations_utils
+
+
+class Migration(migrations.Migration):
+    operations = [
+        migrations_utils.RunProcrastinateSQL(
+            name="02.08.00_03_fetch_job_custom_plan.sql"
+        ),
+    ]
+    name = "0031_fetch_job_custom_plan"
+    dependencies = [("procrastinate", "0030_add_defer_jobs_function")]
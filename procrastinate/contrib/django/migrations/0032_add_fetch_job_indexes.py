@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from django.db import migrations
+
+from .. import migrations_utils
+
+
+class Migration(migrations.Migration):
+    operations = [
+        migrations_utils.RunProcrastinateSQL(
+            name="02.08.00_04_add_fetch_job_indexes.sql"
+        ),
+    ]
+    name = "0032_add_fetch_job_indexes"
+    dependencies = [("procrastinate", "0031_fetch_job_custom_plan")]
@@ -132,13 +132,15 @@ class SQLAlchemyPsycopg2Connector(connector.BaseConnector):
             raise exceptions.AppNotOpen
         return self._engine
 
+    def _wrap_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return Json(value, dumps=self.json_dumps)
+        elif isinstance(value, list):
+            return [self._wrap_value(item) for item in value]
+        return value
+
     def _wrap_json(self, arguments: dict[str, Any]):
-        return {
-            key: Json(value, dumps=self.json_dumps)
-            if isinstance(value, dict)
-            else value
-            for key, value in arguments.items()
-        }
+        return {key: self._wrap_value(value) for key, value in arguments.items()}
 
     @wrap_exceptions()
     @wrap_query_exceptions
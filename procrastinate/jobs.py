@@ -141,6 +141,15 @@ class JobDeferrer:
 
         return self.job.evolve(task_kwargs=final_kwargs)
 
+    def _make_new_jobs(self, *task_kwargs: types.JSONDict) -> list[Job]:
+        if self.job.queueing_lock is not None and len(task_kwargs) > 1:
+            raise ValueError(
+                "Cannot batch defer several jobs with the same queueing lock "
+                f"{self.job.queueing_lock}: only one of them could be waiting in "
+                "the queue"
+            )
+        return [self.make_new_job(**kwargs) for kwargs in task_kwargs]
+
     def _log_before_defer_job(self, job: Job) -> None:
         logger.debug(
             f"About to defer job {job.call_string}",
@@ -173,3 +182,32 @@ class JobDeferrer:
         self._log_after_defer_job(job=job)
         assert job.id  # for mypy
         return job.id
+
+    async def batch_defer_async(self, *task_kwargs: types.JSONDict) -> list[int]:
+        """
+        See `Task.batch_defer` for details.
+        """
+        # Make sure this code stays synchronized with .batch_defer()
+        new_jobs = self._make_new_jobs(*task_kwargs)
+        for job in new_jobs:
+            self._log_before_defer_job(job=job)
+        new_jobs = await self.job_manager.batch_defer_jobs_async(jobs_to_defer=new_jobs)
+        job_ids = []
+        for job in new_jobs:
+            self._log_after_defer_job(job=job)
+            assert job.id  # for mypy
+            job_ids.append(job.id)
+        return job_ids
+
+    def batch_defer(self, *task_kwargs: types.JSONDict) -> list[int]:
+        # Make sure this code stays synchronized with .batch_defer_async()
+        new_jobs = self._make_new_jobs(*task_kwargs)
+        for job in new_jobs:
+            self._log_before_defer_job(job=job)
+        new_jobs = self.job_manager.batch_defer_jobs(jobs_to_defer=new_jobs)
+        job_ids = []
+        for job in new_jobs:
+            self._log_after_defer_job(job=job)
+            assert job.id  # for mypy
+            job_ids.append(job.id)
+        return job_ids
@@ -71,6 +71,84 @@ class JobManager:
             "scheduled_at": job.scheduled_at,
         }
 
+    async def batch_defer_jobs_async(
+        self, jobs_to_defer: list[jobs.Job]
+    ) -> list[jobs.Job]:
+        """
+        Add several jobs in their queues for later processing by a worker, in a
+        single query.
+
+        Parameters
+        ----------
+        jobs_to_defer : ``List[jobs.Job]``
+
+        Returns
+        -------
+        ``List[jobs.Job]``
+            Copies of the job instances with their id set, in the same order.
+        """
+        # Make sure this code stays synchronized with .batch_defer_jobs()
+        if not jobs_to_defer:
+            return []
+        try:
+            rows = await self.connector.execute_query_all_async(
+                **self._defer_jobs_query_kwargs(jobs_to_defer=jobs_to_defer)
+            )
+        except exceptions.UniqueViolation as exc:
+            self._raise_batch_already_enqueued(exc=exc, jobs_to_defer=jobs_to_defer)
+
+        return [
+            job.evolve(id=row["id"], status=jobs.Status.TODO.value)
+            for job, row in zip(jobs_to_defer, rows)
+        ]
+
+    def batch_defer_jobs(self, jobs_to_defer: list[jobs.Job]) -> list[jobs.Job]:
+        """
+        Sync version of `batch_defer_jobs_async`.
+        """
+        if not jobs_to_defer:
+            return []
+        try:
+            rows = self.connector.get_sync_connector().execute_query_all(
+                **self._defer_jobs_query_kwargs(jobs_to_defer=jobs_to_defer)
+            )
+        except exceptions.UniqueViolation as exc:
+            self._raise_batch_already_enqueued(exc=exc, jobs_to_defer=jobs_to_defer)
+
+        return [
+            job.evolve(id=row["id"], status=jobs.Status.TODO.value)
+            for job, row in zip(jobs_to_defer, rows)
+        ]
+
+    def _defer_jobs_query_kwargs(self, jobs_to_defer: list[jobs.Job]) -> dict[str, Any]:
+        return {
+            "query": sql.queries["defer_jobs"],
+            "task_names": [job.task_name for job in jobs_to_defer],
+            "queues": [job.queue for job in jobs_to_defer],
+            "priorities": [job.priority for job in jobs_to_defer],
+            "locks": [job.lock for job in jobs_to_defer],
+            "queueing_locks": [job.queueing_lock for job in jobs_to_defer],
+            "args": [job.task_kwargs for job in jobs_to_defer],
+            "scheduled_ats": [job.scheduled_at for job in jobs_to_defer],
+        }
+
+    def _raise_batch_already_enqueued(
+        self, exc: exceptions.UniqueViolation, jobs_to_defer: list[jobs.Job]
+    ) -> NoReturn:
+        if exc.constraint_name == QUEUEING_LOCK_CONSTRAINT:
+            queueing_locks = ", ".join(
+                dict.fromkeys(
+                    job.queueing_lock
+                    for job in jobs_to_defer
+                    if job.queueing_lock is not None
+                )
+            )
+            raise exceptions.AlreadyEnqueued(
+                "Jobs cannot be enqueued: there is already a job in the queue "
+                f"with one of the queueing locks {queueing_locks}"
+            ) from exc
+        raise exc
+
     def _raise_already_enqueued(
         self, exc: exceptions.UniqueViolation, queueing_lock: str | None
     ) -> NoReturn:
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import logging
 from typing import (
     TYPE_CHECKING,
@@ -66,7 +67,9 @@ class PsycopgConnector(connector.BaseAsyncConnector):
 
         ``json_dumps`` and ``json_loads`` are used to configure new connections
         created by the pool with ``psycopg.types.json.set_json_dumps`` and
-        ``psycopg.types.json.set_json_loads``.
+        ``psycopg.types.json.set_json_loads``. These connections are also put
+        in autocommit mode (each query procrastinate runs is a single
+        statement), unless your own ``configure`` callback changes it.
 
         .. __: https://www.psycopg.org/psycopg3/docs/api/pool.html
                #psycopg_pool.AsyncConnectionPool
@@ -153,7 +156,7 @@ class PsycopgConnector(connector.BaseAsyncConnector):
         pool_args: dict[str, Any],
     ) -> psycopg_pool.AsyncConnectionPool:
         return self._pool_factory(
-            **pool_args,
+            **{**pool_args, "configure": self._configure_connection},
             # Not specifying open=False raises a warning and will be deprecated.
             # It makes sense, as we can't really make async I/Os in a constructor.
             open=False,
@@ -174,11 +177,28 @@ class PsycopgConnector(connector.BaseAsyncConnector):
         await self._async_pool.close()
         self._async_pool = None
 
+    def _wrap_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return psycopg.types.json.Jsonb(value)
+        elif isinstance(value, list):
+            return [self._wrap_value(item) for item in value]
+        return value
+
     def _wrap_json(self, arguments: dict[str, Any]):
-        return {
-            key: psycopg.types.json.Jsonb(value) if isinstance(value, dict) else value
-            for key, value in arguments.items()
-        }
+        return {key: self._wrap_value(value) for key, value in arguments.items()}
+
+    async def _configure_connection(self, connection: psycopg.AsyncConnection) -> None:
+        # Every query we run is a single statement: running them in autocommit
+        # saves the round-trips of the implicit BEGIN and of the COMMIT.
+        await connection.set_autocommit(True)
+        # Adapters are registered once per connection, when the pool creates
+        # it, rather than on every cursor.
+        sync_psycopg_connector.configure_json(
+            context=connection, loads=self._json_loads, dumps=self._json_dumps
+        )
+        configure = self._pool_args.get("configure")
+        if configure:
+            await configure(connection)
 
     @contextlib.asynccontextmanager
     async def _get_cursor(
@@ -186,28 +206,33 @@ class PsycopgConnector(connector.BaseAsyncConnector):
     ) -> AsyncIterator[psycopg.AsyncCursor[psycopg.rows.DictRow]]:
         async with self.pool.connection() as connection:
             async with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-                if self._json_loads:
-                    psycopg.types.json.set_json_loads(
-                        loads=self._json_loads, context=cursor
-                    )
-
-                if self._json_dumps:
-                    psycopg.types.json.set_json_dumps(
-                        dumps=self._json_dumps, context=cursor
+                if self._pool_externally_set:
+                    # We don't control how the connections of an external pool
+                    # are configured.
+                    sync_psycopg_connector.configure_json(
+                        context=cursor, loads=self._json_loads, dumps=self._json_dumps
                     )
                 yield cursor
 
     @wrap_exceptions()
     async def execute_query_async(self, query: LiteralString, **arguments: Any) -> None:
         async with self._get_cursor() as cursor:
-            await cursor.execute(query, self._wrap_json(arguments))
+            await cursor.execute(
+                query,
+                self._wrap_json(arguments),
+                prepare=sync_psycopg_connector.should_prepare(query),
+            )
 
     @wrap_exceptions()
     async def execute_query_one_async(
         self, query: LiteralString, **arguments: Any
     ) -> dict[str, Any]:
         async with self._get_cursor() as cursor:
-            await cursor.execute(query, self._wrap_json(arguments))
+            await cursor.execute(
+                query,
+                self._wrap_json(arguments),
+                prepare=sync_psycopg_connector.should_prepare(query),
+            )
 
             result = await cursor.fetchone()
 
@@ -220,12 +245,19 @@ class PsycopgConnector(connector.BaseAsyncConnector):
         self, query: LiteralString, **arguments: Any
     ) -> list[dict[str, Any]]:
         async with self._get_cursor() as cursor:
-            await cursor.execute(query, self._wrap_json(arguments))
+            await cursor.execute(
+                query,
+                self._wrap_json(arguments),
+                prepare=sync_psycopg_connector.should_prepare(query),
+            )
 
             return await cursor.fetchall()
 
+    # Composing the query is pure Python work that gives the same result every
+    # time the listener (re)connects to the same channels.
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _make_dynamic_query(
-        self,
         query: LiteralString,
         **identifiers: str,
     ) -> psycopg.sql.Composed:
@@ -237,13 +269,10 @@ class PsycopgConnector(connector.BaseAsyncConnector):
     async def _get_standalone_connection(
         self,
     ) -> AsyncIterator[psycopg.AsyncConnection]:
-        configure = self._pool_args.get("configure")
-
         async with await self.pool.connection_class.connect(
             self.pool.conninfo, **self.pool.kwargs, autocommit=True
         ) as connection:
-            if configure:
-                await configure(connection)
+            await self._configure_connection(connection)
 
             yield connection
 
@@ -253,13 +282,16 @@ class PsycopgConnector(connector.BaseAsyncConnector):
     ) -> None:
         while True:
             async with self._get_standalone_connection() as connection:
-                for channel_name in channels:
-                    await connection.execute(
-                        query=self._make_dynamic_query(
-                            query=sql.queries["listen_queue"],
-                            channel_name=channel_name,
-                        ),
+                # All the channels are listened to in a single round-trip
+                listen_queries = [
+                    self._make_dynamic_query(
+                        query=sql.queries["listen_queue"],
+                        channel_name=channel_name,
                     )
+                    for channel_name in channels
+                ]
+                if listen_queries:
+                    await connection.execute(query=psycopg.sql.Composed(listen_queries))
                 # Initial set() lets caller know that we're ready to listen
                 event.set()
                 await self._loop_notify(event=event, connection=connection)
@@ -0,0 +1,24 @@
+CREATE FUNCTION procrastinate_defer_jobs(
+    queue_names character varying[],
+    task_names character varying[],
+    priorities integer[],
+    locks text[],
+    queueing_locks text[],
+    args jsonb[],
+    scheduled_ats timestamp with time zone[]
+)
+    RETURNS SETOF bigint
+    LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- A single INSERT for all the jobs. Rows are inserted (and get their ids)
+    -- in the order of the arrays, so ordering by id keeps that order.
+    RETURN QUERY
+    WITH inserted_jobs AS (
+        INSERT INTO procrastinate_jobs (queue_name, task_name, priority, lock, queueing_lock, args, scheduled_at)
+        SELECT * FROM unnest(queue_names, task_names, priorities, locks, queueing_locks, args, scheduled_ats)
+        RETURNING id
+    )
+    SELECT inserted_jobs.id FROM inserted_jobs ORDER BY inserted_jobs.id;
+END;
+$$;
@@ -0,0 +1,2 @@
+ALTER FUNCTION procrastinate_fetch_job(character varying[])
+    SET plan_cache_mode TO force_custom_plan;
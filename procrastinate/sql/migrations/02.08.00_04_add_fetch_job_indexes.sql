@@ -0,0 +1,6 @@
+-- procrastinate_fetch_job also considers 'aborting' jobs when looking for
+-- earlier jobs with the same lock: the index has to include them to be usable.
+DROP INDEX procrastinate_jobs_id_lock_idx;
+CREATE INDEX procrastinate_jobs_id_lock_idx ON procrastinate_jobs (id, lock) WHERE status = ANY (ARRAY['todo'::procrastinate_job_status, 'doing'::procrastinate_job_status, 'aborting'::procrastinate_job_status]);
+
+CREATE INDEX procrastinate_jobs_priority_idx ON procrastinate_jobs (priority DESC, id ASC) WHERE status = 'todo';
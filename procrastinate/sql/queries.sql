@@ -7,6 +7,10 @@
 -- Create and enqueue a job
 SELECT procrastinate_defer_job(%(queue)s, %(task_name)s, %(priority)s, %(lock)s, %(queueing_lock)s, %(args)s, %(scheduled_at)s) AS id;
 
+-- defer_jobs --
+-- Create and enqueue several jobs in a single query, returns their ids in order
+SELECT procrastinate_defer_jobs(%(queues)s::character varying[], %(task_names)s::character varying[], %(priorities)s::integer[], %(locks)s::text[], %(queueing_locks)s::text[], %(args)s::jsonb[], %(scheduled_ats)s::timestamp with time zone[]) AS id;
+
 -- defer_periodic_job --
 -- Create a periodic job if it doesn't already exist, and delete periodic metadata
 -- for previous jobs in the same task.
@@ -65,7 +65,9 @@ CREATE UNIQUE INDEX procrastinate_jobs_queueing_lock_idx ON procrastinate_jobs (
 CREATE UNIQUE INDEX procrastinate_jobs_lock_idx ON procrastinate_jobs (lock) WHERE status = 'doing';
 
 CREATE INDEX procrastinate_jobs_queue_name_idx ON procrastinate_jobs(queue_name);
-CREATE INDEX procrastinate_jobs_id_lock_idx ON procrastinate_jobs (id, lock) WHERE status = ANY (ARRAY['todo'::procrastinate_job_status, 'doing'::procrastinate_job_status]);
+CREATE INDEX procrastinate_jobs_id_lock_idx ON procrastinate_jobs (id, lock) WHERE status = ANY (ARRAY['todo'::procrastinate_job_status, 'doing'::procrastinate_job_status, 'aborting'::procrastinate_job_status]);
+-- this lets procrastinate_fetch_job read the awaiting jobs in order
+CREATE INDEX procrastinate_jobs_priority_idx ON procrastinate_jobs (priority DESC, id ASC) WHERE status = 'todo';
 
 CREATE INDEX procrastinate_events_job_id_fkey ON procrastinate_events(job_id);
 
@@ -97,6 +99,31 @@ BEGIN
 END;
 $$;
 
+CREATE FUNCTION procrastinate_defer_jobs(
+    queue_names character varying[],
+    task_names character varying[],
+    priorities integer[],
+    locks text[],
+    queueing_locks text[],
+    args jsonb[],
+    scheduled_ats timestamp with time zone[]
+)
+    RETURNS SETOF bigint
+    LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- A single INSERT for all the jobs. Rows are inserted (and get their ids)
+    -- in the order of the arrays, so ordering by id keeps that order.
+    RETURN QUERY
+    WITH inserted_jobs AS (
+        INSERT INTO procrastinate_jobs (queue_name, task_name, priority, lock, queueing_lock, args, scheduled_at)
+        SELECT * FROM unnest(queue_names, task_names, priorities, locks, queueing_locks, args, scheduled_ats)
+        RETURNING id
+    )
+    SELECT inserted_jobs.id FROM inserted_jobs ORDER BY inserted_jobs.id;
+END;
+$$;
+
 CREATE FUNCTION procrastinate_defer_periodic_job(
     _queue_name character varying,
     _lock character varying,
@@ -155,11 +182,15 @@ BEGIN
 END;
 $$;
 
+-- procrastinate_fetch_job
+-- Planned for each call with the actual queue names: a generic plan can't
+-- simplify the optional queue filter, and is blind to skewed queues.
 CREATE FUNCTION procrastinate_fetch_job(
     target_queue_names character varying[]
 )
     RETURNS procrastinate_jobs
     LANGUAGE plpgsql
+    SET plan_cache_mode TO force_custom_plan
 AS $$
 DECLARE
 	found_jobs procrastinate_jobs;
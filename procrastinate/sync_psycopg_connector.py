@@ -5,16 +5,53 @@ import logging
 from typing import Any, Callable, Generator, Iterator
 
 import psycopg
+import psycopg.abc
 import psycopg.rows
 import psycopg.sql
 import psycopg.types.json
 import psycopg_pool
 from typing_extensions import LiteralString
 
-from procrastinate import connector, exceptions
+from procrastinate import connector, exceptions, sql
 
 logger = logging.getLogger(__name__)
 
+# Queries that run once (or more) for every job. psycopg only prepares a
+# statement once it has been executed ``prepare_threshold`` times on a given
+# connection: preparing these straight away saves their parsing and planning on
+# every subsequent call. Preparation can still be disabled altogether (e.g. when
+# using PgBouncer in transaction mode) by passing ``prepare_threshold=None`` in
+# the connection ``kwargs``.
+PREPARED_QUERIES = frozenset(
+    sql.queries[name]
+    for name in ("defer_job", "fetch_job", "finish_job", "retry_job", "get_job_status")
+)
+
+
+def should_prepare(query: Any) -> bool | None:
+    """
+    Value of the ``prepare`` argument of psycopg's ``execute`` for this query.
+    ``None`` lets psycopg decide by itself. Composed queries (e.g. from
+    ``psycopg.sql.SQL.format``) are not hashable, and never prepared.
+    """
+    return True if isinstance(query, str) and query in PREPARED_QUERIES else None
+
+
+def configure_json(
+    context: psycopg.abc.AdaptContext,
+    loads: Callable | None,
+    dumps: Callable | None,
+) -> None:
+    """
+    Register custom JSON loads and dumps functions (if any) on a psycopg
+    adaptation context (a connection or a cursor).
+    """
+    if loads:
+        psycopg.types.json.set_json_loads(loads=loads, context=context)
+
+    if dumps:
+        psycopg.types.json.set_json_dumps(dumps=dumps, context=context)
+
 
 @contextlib.contextmanager
 def wrap_exceptions() -> Generator[None, None, None]:
@@ -54,7 +91,9 @@ class SyncPsycopgConnector(connector.BaseConnector):
 
         ``json_dumps`` and ``json_loads`` are used to configure new connections
         created by the pool with ``psycopg.types.json.set_json_dumps`` and
-        ``psycopg.types.json.set_json_loads``.
+        ``psycopg.types.json.set_json_loads``. These connections are also put
+        in autocommit mode (each query procrastinate runs is a single
+        statement), unless your own ``configure`` callback changes it.
 
         .. __: https://www.psycopg.org/psycopg3/docs/api/pool.html
 
@@ -102,11 +141,10 @@ class SyncPsycopgConnector(connector.BaseConnector):
             self._pool = self._create_pool(self._pool_args)
             self._pool.open(wait=True)
 
-    @staticmethod
     @wrap_exceptions()
-    def _create_pool(pool_args: dict[str, Any]) -> psycopg_pool.ConnectionPool:
+    def _create_pool(self, pool_args: dict[str, Any]) -> psycopg_pool.ConnectionPool:
         pool = psycopg_pool.ConnectionPool(
-            **pool_args,
+            **{**pool_args, "configure": self._configure_connection},
             # Not specifying open=False raises a warning and will be deprecated.
             # It makes sense, as we can't really make async I/Os in a constructor.
             open=False,
@@ -129,38 +167,56 @@ class SyncPsycopgConnector(connector.BaseConnector):
         self._pool.close()
         self._pool = None
 
+    def _wrap_value(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            return psycopg.types.json.Jsonb(value)
+        elif isinstance(value, list):
+            return [self._wrap_value(item) for item in value]
+        return value
+
     def _wrap_json(self, arguments: dict[str, Any]):
-        return {
-            key: psycopg.types.json.Jsonb(value) if isinstance(value, dict) else value
-            for key, value in arguments.items()
-        }
+        return {key: self._wrap_value(value) for key, value in arguments.items()}
+
+    def _configure_connection(self, connection: psycopg.Connection) -> None:
+        # Every query we run is a single statement: running them in autocommit
+        # saves the round-trips of the implicit BEGIN and of the COMMIT.
+        connection.autocommit = True
+        # Adapters are registered once per connection, when the pool creates
+        # it, rather than on every cursor.
+        configure_json(
+            context=connection, loads=self._json_loads, dumps=self._json_dumps
+        )
+        configure = self._pool_args.get("configure")
+        if configure:
+            configure(connection)
 
     @contextlib.contextmanager
     def _get_cursor(self) -> Iterator[psycopg.Cursor[psycopg.rows.DictRow]]:
         with self.pool.connection() as connection:
             with connection.cursor(row_factory=psycopg.rows.dict_row) as cursor:
-                if self._json_loads:
-                    psycopg.types.json.set_json_loads(
-                        loads=self._json_loads, context=cursor
-                    )
-
-                if self._json_dumps:
-                    psycopg.types.json.set_json_dumps(
-                        dumps=self._json_dumps, context=cursor
+                if self._pool_externally_set:
+                    # We don't control how the connections of an external pool
+                    # are configured.
+                    configure_json(
+                        context=cursor, loads=self._json_loads, dumps=self._json_dumps
                     )
                 yield cursor
 
     @wrap_exceptions()
     def execute_query(self, query: LiteralString, **arguments: Any) -> None:
         with self.pool.connection() as conn:
-            conn.execute(query, self._wrap_json(arguments))
+            conn.execute(
+                query, self._wrap_json(arguments), prepare=should_prepare(query)
+            )
 
     @wrap_exceptions()
     def execute_query_one(
         self, query: LiteralString, **arguments: Any
     ) -> dict[str, Any]:
         with self._get_cursor() as cursor:
-            cursor.execute(query, self._wrap_json(arguments))
+            cursor.execute(
+                query, self._wrap_json(arguments), prepare=should_prepare(query)
+            )
 
             result = cursor.fetchone()
 
@@ -173,6 +229,8 @@ class SyncPsycopgConnector(connector.BaseConnector):
         self, query: LiteralString, **arguments: Any
     ) -> list[dict[str, Any]]:
         with self._get_cursor() as cursor:
-            cursor.execute(query, self._wrap_json(arguments))
+            cursor.execute(
+                query, self._wrap_json(arguments), prepare=should_prepare(query)
+            )
 
             return cursor.fetchall()
@@ -154,6 +154,36 @@ class Task(Generic[P, Args]):
         """
         return self.configure().defer(**task_kwargs)
 
+    async def batch_defer_async(self, *task_kwargs: types.JSONDict) -> list[int]:
+        """
+        Create several jobs from this task, one for each dict of arguments, in a
+        single database query. This is much faster than calling `Task.defer_async`
+        in a loop when deferring many jobs at once.
+        All the jobs will be created with default parameters, if you want to better
+        specify when and how to launch these jobs, see `Task.configure`.
+
+        Returns
+        -------
+        ``List[int]``
+            The ids of the created jobs, in the same order as the arguments.
+        """
+        return await self.configure().batch_defer_async(*task_kwargs)
+
+    def batch_defer(self, *task_kwargs: types.JSONDict) -> list[int]:
+        """
+        Create several jobs from this task, one for each dict of arguments, in a
+        single database query. This is much faster than calling `Task.defer`
+        in a loop when deferring many jobs at once.
+        All the jobs will be created with default parameters, if you want to better
+        specify when and how to launch these jobs, see `Task.configure`.
+
+        Returns
+        -------
+        ``List[int]``
+            The ids of the created jobs, in the same order as the arguments.
+        """
+        return self.configure().batch_defer(*task_kwargs)
+
     def configure(self, **options: Unpack[ConfigureTaskOptions]) -> jobs.JobDeferrer:
         """
         Configure the job with all the specific settings, defining how the job
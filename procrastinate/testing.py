@@ -150,6 +150,45 @@ class InMemoryConnector(connector.BaseAsyncConnector):
                 self.notify_event.set()
         return job_row
 
+    def defer_jobs_all(
+        self,
+        task_names: list[str],
+        priorities: list[int],
+        locks: list[str | None],
+        queueing_locks: list[str | None],
+        args: list[types.JSONDict],
+        scheduled_ats: list[datetime.datetime | None],
+        queues: list[str],
+    ) -> list[JobRow]:
+        # Like the database query, either all the jobs are deferred or none is
+        todo_queueing_locks = {
+            job["queueing_lock"]
+            for job in self.jobs.values()
+            if job["status"] == "todo"
+        }
+        batch_queueing_locks = [lock for lock in queueing_locks if lock is not None]
+        if len(set(batch_queueing_locks)) != len(batch_queueing_locks) or (
+            todo_queueing_locks.intersection(batch_queueing_locks)
+        ):
+            from . import manager
+
+            raise exceptions.UniqueViolation(
+                constraint_name=manager.QUEUEING_LOCK_CONSTRAINT
+            )
+
+        return [
+            self.defer_job_one(
+                task_name=task_names[i],
+                priority=priorities[i],
+                lock=locks[i],
+                queueing_lock=queueing_locks[i],
+                args=args[i],
+                scheduled_at=scheduled_ats[i],
+                queue=queues[i],
+            )
+            for i in range(len(task_names))
+        ]
+
     def defer_periodic_job_one(
         self,
         queue: str,
@@ -108,6 +108,15 @@ async def sync_to_async(func: Callable[..., T], *args, **kwargs) -> T:
     return await sync.sync_to_async(func)(*args, **kwargs)
 
 
+async def sync_to_thread(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Like `sync_to_async`, but each call runs in a thread of the event loop's
+    default executor instead of asgiref's single shared thread, so that several
+    calls can run at the same time.
+    """
+    return await sync.sync_to_async(func, thread_sensitive=False)(*args, **kwargs)
+
+
 def causes(exc: BaseException | None):
     """
     From a single exception with a chain of causes and contexts, make an iterable
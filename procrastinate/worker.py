@@ -51,6 +51,7 @@ class Worker:
         delete_jobs: str | DeleteJobCondition = DeleteJobCondition.NEVER.value,
         additional_context: dict[str, Any] | None = None,
         install_signal_handlers: bool = True,
+        parallel_sync_tasks: bool = False,
     ):
         self.app = app
         self.queues = queues
@@ -68,6 +69,7 @@ class Worker:
 
         self.job_manager = self.app.job_manager
         self.install_signal_handlers = install_signal_handlers
+        self.parallel_sync_tasks = parallel_sync_tasks
 
         if name:
             self.logger = logger.getChild(name)
@@ -158,6 +160,11 @@ class Worker:
     async def single_worker(self, worker_id: int):
         current_timeout = self.timeout * (worker_id + 1)
         while not self.stop_requested:
+            # The event is cleared before fetching rather than before waiting:
+            # a job deferred between an empty fetch and the wait would
+            # otherwise be missed until the timeout expires.
+            if self.notify_event:
+                self.notify_event.clear()
             job = await self.job_manager.fetch_job(self.queues)
             if job:
                 await self.process_job(job=job, worker_id=worker_id)
@@ -175,13 +182,10 @@ class Worker:
                 action="waiting_for_jobs", queues=self.queues
             ),
         )
-        self.notify_event.clear()
         try:
             await asyncio.wait_for(self.notify_event.wait(), timeout=timeout)
         except asyncio.TimeoutError:
             pass
-        else:
-            self.notify_event.clear()
 
     async def process_job(self, job: jobs.Job, worker_id: int = 0) -> None:
         context = self.context_for_worker(worker_id=worker_id, job=job)
@@ -274,6 +278,8 @@ class Worker:
         await_func: Callable[..., Awaitable]
         if inspect.iscoroutinefunction(task.func):
             await_func = task
+        elif self.parallel_sync_tasks:
+            await_func = functools.partial(utils.sync_to_thread, task)
         else:
             await_func = functools.partial(utils.sync_to_async, task)
 
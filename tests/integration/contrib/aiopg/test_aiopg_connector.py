@@ -171,6 +171,25 @@ async def test_listen_notify(aiopg_connector):
         task.cancel()
 
 
+async def test_listen_notify_several_channels(aiopg_connector):
+    event = asyncio.Event()
+
+    task = asyncio.ensure_future(
+        aiopg_connector.listen_notify(
+            channels=["somechannel", "otherchannel"], event=event
+        )
+    )
+    try:
+        await event.wait()
+        event.clear()
+        await aiopg_connector.execute_query_async("""NOTIFY "otherchannel" """)
+        await asyncio.wait_for(event.wait(), timeout=1)
+    except asyncio.TimeoutError:
+        pytest.fail("Notify not received within 1 sec")
+    finally:
+        task.cancel()
+
+
 async def test_loop_notify_stop_when_connection_closed_old_aiopg(aiopg_connector):
     # We want to make sure that the when the connection is closed, the loop end.
     event = asyncio.Event()
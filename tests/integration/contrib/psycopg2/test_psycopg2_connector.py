@@ -109,3 +109,16 @@ def test_close(psycopg2_connector):
     pool = psycopg2_connector._pool
     psycopg2_connector.close()
     assert pool.closed is True
+
+
+def test_dict_row_cursor(psycopg2_connector):
+    with psycopg2_connector._connection() as connection:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 AS a, 'b' AS b FROM generate_series(1, 3)")
+            assert cursor.fetchone() == {"a": 1, "b": "b"}
+            assert cursor.fetchmany() == [{"a": 1, "b": "b"}]
+            assert cursor.fetchall() == [{"a": 1, "b": "b"}]
+            assert cursor.fetchone() is None
+
+            cursor.execute("SELECT 1 AS a, 'b' AS b FROM generate_series(1, 2)")
+            assert list(cursor) == [{"a": 1, "b": "b"}, {"a": 1, "b": "b"}]
@@ -372,6 +372,61 @@ async def test_defer_job(pg_job_manager, get_all, job_factory):
     ]
 
 
+async def test_batch_defer_jobs(pg_job_manager, get_all, job_factory):
+    new_jobs = await pg_job_manager.batch_defer_jobs_async(
+        jobs_to_defer=[
+            job_factory(
+                queue="marsupilami",
+                task_name="bob",
+                lock="sher",
+                queueing_lock="houba",
+                task_kwargs={"a": 1, "b": 2},
+            ),
+            job_factory(
+                queue="lapin",
+                task_name="bill",
+                lock=None,
+                queueing_lock=None,
+                scheduled_at=conftest.aware_datetime(2000, 1, 1),
+            ),
+        ]
+    )
+
+    result = await get_all(
+        "procrastinate_jobs",
+        "id",
+        "args",
+        "status",
+        "lock",
+        "queueing_lock",
+        "task_name",
+        "queue_name",
+        "scheduled_at",
+    )
+    assert result == [
+        {
+            "id": new_jobs[0].id,
+            "args": {"a": 1, "b": 2},
+            "status": "todo",
+            "lock": "sher",
+            "queueing_lock": "houba",
+            "task_name": "bob",
+            "queue_name": "marsupilami",
+            "scheduled_at": None,
+        },
+        {
+            "id": new_jobs[1].id,
+            "args": {},
+            "status": "todo",
+            "lock": None,
+            "queueing_lock": None,
+            "task_name": "bill",
+            "queue_name": "lapin",
+            "scheduled_at": conftest.aware_datetime(2000, 1, 1),
+        },
+    ]
+
+
 async def test_defer_job_violate_queueing_lock(pg_job_manager, job_factory):
     await pg_job_manager.defer_job_async(
         job_factory(
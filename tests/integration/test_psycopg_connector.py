@@ -59,6 +59,18 @@ async def test_execute_query_json_dumps(
     assert result == expected
 
 
+async def test_execute_query_json_dumps_bytes(psycopg_connector_factory):
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+    connector = await psycopg_connector_factory(json_dumps=json_dumps)
+
+    result = await connector.execute_query_one_async(
+        "SELECT %(arg)s::jsonb as json", arg={"a": "b"}
+    )
+    assert result == {"json": {"a": "b"}}
+
+
 async def test_json_loads(psycopg_connector_factory, mocker):
     @attr.dataclass
     class Param:
@@ -79,6 +91,41 @@ async def test_json_loads(psycopg_connector_factory, mocker):
     assert result["json"] == {"a": 1, "b": Param(p=2)}
 
 
+async def test_json_loads_external_pool(psycopg_connection_params, mocker):
+    json_loads = mocker.Mock(return_value={"a": 2})
+    connector = psycopg_connector.PsycopgConnector(json_loads=json_loads)
+
+    async with psycopg_connector.psycopg_pool.AsyncConnectionPool(
+        **psycopg_connection_params, open=False
+    ) as pool:
+        await connector.open_async(pool=pool)
+        result = await connector.execute_query_one_async(
+            "SELECT %(arg)s::jsonb as json", arg={"a": 1}
+        )
+
+    assert result["json"] == {"a": 2}
+
+
+async def test_pool_connections_autocommit(psycopg_connector):
+    async with psycopg_connector.pool.connection() as connection:
+        assert connection.autocommit is True
+
+
+async def test_pool_applies_configure(psycopg_connector_factory, mocker):
+    async def configure(connection):
+        connection.attr = "value"
+
+    json_loads = mocker.Mock(return_value={"a": 2})
+    connector = await psycopg_connector_factory(
+        configure=configure, json_loads=json_loads
+    )
+
+    async with connector.pool.connection() as connection:
+        assert connection.attr == "value"
+        cursor = await connection.execute("SELECT '{}'::jsonb as json")
+        assert await cursor.fetchone() == ({"a": 2},)
+
+
 async def test_execute_query(psycopg_connector):
     assert (
         await psycopg_connector.execute_query_async(
@@ -181,6 +228,25 @@ async def test_listen_notify(psycopg_connector):
         task.cancel()
 
 
+async def test_listen_notify_several_channels(psycopg_connector):
+    event = asyncio.Event()
+
+    task = asyncio.ensure_future(
+        psycopg_connector.listen_notify(
+            channels=["somechannel", "otherchannel"], event=event
+        )
+    )
+    try:
+        await asyncio.wait_for(event.wait(), timeout=0.2)
+        event.clear()
+        await psycopg_connector.execute_query_async("""NOTIFY "otherchannel" """)
+        await asyncio.wait_for(event.wait(), timeout=1)
+    except asyncio.TimeoutError:
+        pytest.fail("Notify not received within 1 sec")
+    finally:
+        task.cancel()
+
+
 async def test_get_standalone_connection_applies_configure(psycopg_connector_factory):
     async def configure(connection):
         connection.attr = "value"
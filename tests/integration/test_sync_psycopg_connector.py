@@ -63,6 +63,11 @@ def test_json_loads(sync_psycopg_connector_factory, mocker):
     assert connector._json_loads is loads
 
 
+def test_pool_connections_autocommit(sync_psycopg_connector):
+    with sync_psycopg_connector.pool.connection() as connection:
+        assert connection.autocommit is True
+
+
 def test_execute_query(sync_psycopg_connector):
     sync_psycopg_connector.execute_query(
         "COMMENT ON TABLE \"procrastinate_jobs\" IS 'foo'"
@@ -24,6 +24,19 @@ def test_wrap_exceptions_success():
     assert func(1, 2) == (1, 2)
 
 
+def test_dict_row_cursor_iter(mocker):
+    # psycopg2's cursor type is immutable, so the rows are mocked one level up.
+    # A cursor that was never executed doesn't need a connection.
+    cursor = psycopg2_connector.DictRowCursor.__new__(psycopg2_connector.DictRowCursor)
+    mocker.patch.object(
+        psycopg2_connector.DictRowCursor,
+        "fetchone",
+        side_effect=[{"a": 1}, {"a": 2}, None],
+    )
+
+    assert list(cursor) == [{"a": 1}, {"a": 2}]
+
+
 @pytest.mark.parametrize("pool_args, called_count", [({"maxconn": 5}, 6), ({}, 1)])
 def test_wrap_query_exceptions_reached_max_tries(mocker, pool_args, called_count):
     called = []
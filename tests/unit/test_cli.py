@@ -51,6 +51,10 @@ def test_main(mocker):
             ["worker", "--no-listen-notify"],
             {"command": "worker", "listen_notify": False},
         ),
+        (
+            ["worker", "--parallel-sync-tasks"],
+            {"command": "worker", "parallel_sync_tasks": True},
+        ),
         (
             ["worker", "--delete-jobs", "never"],
             {"command": "worker", "delete_jobs": worker.DeleteJobCondition.NEVER},
@@ -83,6 +83,43 @@ async def test_job_deferrer_defer_async(job_factory, job_manager, connector):
     }
 
 
+async def test_job_deferrer_batch_defer_async(job_factory, job_manager, connector):
+    job = job_factory(queue="marsupilami", task_name="mytask", task_kwargs={"a": "b"})
+
+    deferrer = jobs.JobDeferrer(job=job, job_manager=job_manager)
+    ids = await deferrer.batch_defer_async({"c": 3}, {"c": 4})
+
+    assert ids == [1, 2]
+    assert connector.jobs[1]["args"] == {"a": "b", "c": 3}
+    assert connector.jobs[2]["args"] == {"a": "b", "c": 4}
+
+
+def test_job_deferrer_batch_defer(job_factory, job_manager, connector):
+    job = job_factory(queue="marsupilami", task_name="mytask", task_kwargs={"a": "b"})
+
+    deferrer = jobs.JobDeferrer(job=job, job_manager=job_manager)
+    ids = deferrer.batch_defer({"c": 3}, {"c": 4})
+
+    assert ids == [1, 2]
+    assert connector.jobs[1]["args"] == {"a": "b", "c": 3}
+    assert connector.jobs[2]["args"] == {"a": "b", "c": 4}
+
+
+async def test_job_deferrer_batch_defer_queueing_lock(
+    job_factory, job_manager, connector
+):
+    job = job_factory(task_name="mytask", queueing_lock="houba")
+
+    deferrer = jobs.JobDeferrer(job=job, job_manager=job_manager)
+    with pytest.raises(ValueError, match="houba"):
+        await deferrer.batch_defer_async({"c": 3}, {"c": 4})
+    with pytest.raises(ValueError, match="houba"):
+        deferrer.batch_defer({"c": 3}, {"c": 4})
+
+    assert connector.jobs == {}
+    assert deferrer.batch_defer({"c": 3}) == [1]
+
+
 def test_job_scheduled_at_naive(job_factory):
     with pytest.raises(ValueError):
         job_factory(scheduled_at=datetime.datetime(2000, 1, 1))
@@ -39,6 +39,74 @@ async def test_manager_defer_job(job_manager, job_factory, connector):
     }
 
 
+async def test_manager_batch_defer_jobs(job_manager, job_factory, connector):
+    result = await job_manager.batch_defer_jobs_async(
+        jobs_to_defer=[
+            job_factory(task_kwargs={"a": "b"}, queue="marsupilami", lock="sher"),
+            job_factory(task_kwargs={"c": "d"}, queue="lapin", priority=5),
+        ]
+    )
+
+    assert [job.id for job in result] == [1, 2]
+    assert [job.status for job in result] == ["todo", "todo"]
+
+    assert connector.jobs[1]["args"] == {"a": "b"}
+    assert connector.jobs[1]["queue_name"] == "marsupilami"
+    assert connector.jobs[1]["lock"] == "sher"
+    assert connector.jobs[2]["args"] == {"c": "d"}
+    assert connector.jobs[2]["queue_name"] == "lapin"
+    assert connector.jobs[2]["priority"] == 5
+    assert [query for query, _ in connector.queries] == ["defer_jobs"]
+
+
+def test_manager_batch_defer_jobs_sync(job_manager, job_factory, connector):
+    result = job_manager.batch_defer_jobs(
+        jobs_to_defer=[job_factory(task_name="a"), job_factory(task_name="b")]
+    )
+
+    assert [job.id for job in result] == [1, 2]
+    assert [job["task_name"] for job in connector.jobs.values()] == ["a", "b"]
+
+
+async def test_manager_batch_defer_jobs_empty(job_manager, connector):
+    assert await job_manager.batch_defer_jobs_async(jobs_to_defer=[]) == []
+    assert job_manager.batch_defer_jobs(jobs_to_defer=[]) == []
+
+    assert connector.queries == []
+
+
+async def test_manager_batch_defer_jobs_unique_violation_exception(
+    mocker, job_manager, job_factory, connector
+):
+    connector.execute_query_all_async = mocker.Mock(
+        side_effect=exceptions.UniqueViolation(
+            constraint_name="procrastinate_jobs_queueing_lock_idx"
+        )
+    )
+
+    with pytest.raises(
+        exceptions.AlreadyEnqueued, match="one of the queueing locks houba, bar"
+    ):
+        await job_manager.batch_defer_jobs_async(
+            jobs_to_defer=[
+                job_factory(),
+                job_factory(queueing_lock="houba"),
+                job_factory(queueing_lock="bar"),
+            ]
+        )
+
+
+async def test_manager_batch_defer_jobs_unique_violation_exception_other_constraint(
+    mocker, job_manager, job_factory, connector
+):
+    connector.execute_query_all_async = mocker.Mock(
+        side_effect=exceptions.UniqueViolation(constraint_name="some_other_constraint")
+    )
+
+    with pytest.raises(exceptions.UniqueViolation):
+        await job_manager.batch_defer_jobs_async(jobs_to_defer=[job_factory()])
+
+
 async def test_manager_defer_job_no_lock(job_manager, job_factory, connector):
     await job_manager.defer_job_async(job=job_factory())
 
@@ -99,3 +99,10 @@ async def test_open_async_pool_factory_argument_specified(mocker):
 def test_get_pool(connector):
     with pytest.raises(exceptions.AppNotOpen):
         _ = connector.pool
+
+
+def test_make_dynamic_query_cached(connector):
+    query = connector._make_dynamic_query(query="LISTEN {name};", name="foo")
+
+    assert query.as_string(None) == 'LISTEN "foo";'
+    assert connector._make_dynamic_query(query="LISTEN {name};", name="foo") is query
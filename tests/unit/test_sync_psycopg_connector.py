@@ -70,3 +70,42 @@ def test_get_pool():
 
     with pytest.raises(exceptions.AppNotOpen):
         _ = connector.pool
+
+
+@pytest.mark.parametrize(
+    "query_name, expected",
+    [
+        ("defer_job", True),
+        ("fetch_job", True),
+        ("finish_job", True),
+        ("list_jobs", None),
+    ],
+)
+def test_should_prepare(query_name, expected):
+    query = sync_psycopg_connector.sql.queries[query_name]
+    assert sync_psycopg_connector.should_prepare(query) is expected
+
+
+def test_should_prepare_composed_query():
+    query = psycopg.sql.SQL("LISTEN {channel}").format(
+        channel=psycopg.sql.Identifier("foo")
+    )
+    assert sync_psycopg_connector.should_prepare(query) is None
+
+
+@pytest.mark.parametrize(
+    "query_name, expected",
+    [
+        ("fetch_job", True),
+        ("list_jobs", None),
+    ],
+)
+def test_execute_query_all_prepare(mocker, query_name, expected):
+    connector = sync_psycopg_connector.SyncPsycopgConnector()
+    get_cursor = mocker.patch.object(connector, "_get_cursor")
+    cursor = get_cursor.return_value.__enter__.return_value
+    query = sync_psycopg_connector.sql.queries[query_name]
+
+    connector.execute_query_all(query)
+
+    cursor.execute.assert_called_once_with(query, {}, prepare=expected)
@@ -42,6 +42,23 @@ async def test_task_defer_async(app: App, connector):
     }
 
 
+async def test_task_batch_defer_async(app: App, connector):
+    task = tasks.Task(task_func, blueprint=app, queue="queue")
+
+    assert await task.batch_defer_async({"c": 3}, {"c": 4}) == [1, 2]
+
+    assert [job["args"] for job in connector.jobs.values()] == [{"c": 3}, {"c": 4}]
+    assert {job["queue_name"] for job in connector.jobs.values()} == {"queue"}
+
+
+def test_task_batch_defer(app: App, connector):
+    task = tasks.Task(task_func, blueprint=app, queue="queue")
+
+    assert task.batch_defer({"c": 3}, {"c": 4}) == [1, 2]
+
+    assert [job["args"] for job in connector.jobs.values()] == [{"c": 3}, {"c": 4}]
+
+
 async def test_task_default_priority(app: App, connector):
     task = tasks.Task(task_func, blueprint=app, queue="queue", priority=7)
 
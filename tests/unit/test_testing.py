@@ -139,6 +139,39 @@ def test_defer_same_job_with_queueing_lock_second_time_after_first_one_succeeded
     assert len(connector.jobs) == 2
 
 
+@pytest.mark.parametrize(
+    "existing_queueing_lock, queueing_locks",
+    [
+        ("b", ["a", "b"]),
+        (None, ["a", "a"]),
+    ],
+)
+def test_defer_jobs_all_queueing_lock_defers_nothing(
+    connector, existing_queueing_lock, queueing_locks
+):
+    connector.defer_job_one(
+        task_name="mytask",
+        priority=0,
+        lock=None,
+        queueing_lock=existing_queueing_lock,
+        args={},
+        scheduled_at=None,
+        queue="default",
+    )
+
+    with pytest.raises(exceptions.UniqueViolation):
+        connector.defer_jobs_all(
+            task_names=["mytask", "mytask"],
+            priorities=[0, 0],
+            locks=[None, None],
+            queueing_locks=queueing_locks,
+            args=[{}, {}],
+            scheduled_ats=[None, None],
+            queues=["default", "default"],
+        )
+    assert len(connector.jobs) == 1
+
+
 def test_current_locks(connector):
     connector.jobs = {
         1: {"status": "todo", "lock": "foo"},
@@ -4,6 +4,7 @@ import asyncio
 import datetime
 import functools
 import sys
+import threading
 import time
 import types
 
@@ -50,6 +51,21 @@ def test_sync_await():
     assert result == [1]
 
 
+async def test_sync_to_thread():
+    barrier = threading.Barrier(2, timeout=1)
+
+    def func():
+        # Only returns if both calls run at the same time
+        barrier.wait()
+        return threading.get_ident()
+
+    results = await asyncio.gather(
+        utils.sync_to_thread(func), utils.sync_to_thread(func)
+    )
+
+    assert len(set(results)) == 2
+
+
 def test_causes():
     e1, e2, e3 = AttributeError("foo"), KeyError("bar"), IndexError("baz")
 
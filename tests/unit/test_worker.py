@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from procrastinate import exceptions, job_context, jobs, tasks, worker
+from procrastinate import exceptions, job_context, jobs, tasks, utils, worker
 from procrastinate.retry import RetryDecision
 
 from .. import conftest
@@ -222,6 +222,35 @@ async def test_run_job(app):
     assert result == [12]
 
 
+@pytest.mark.parametrize(
+    "parallel_sync_tasks, helper",
+    [(False, "sync_to_async"), (True, "sync_to_thread")],
+)
+async def test_run_job_sync_threads(app, mocker, parallel_sync_tasks, helper):
+    helper_mock = mocker.patch(
+        f"procrastinate.utils.{helper}", side_effect=utils.sync_to_async
+    )
+
+    @app.task(queue="yay", name="task_func")
+    def task_func(a, b):
+        return a + b
+
+    job = jobs.Job(
+        id=16,
+        task_kwargs={"a": 9, "b": 3},
+        lock="sherlock",
+        queueing_lock="houba",
+        task_name="task_func",
+        queue="yay",
+    )
+    test_worker = worker.Worker(
+        app, queues=["yay"], parallel_sync_tasks=parallel_sync_tasks
+    )
+    await test_worker.run_job(job=job, worker_id=3)
+
+    helper_mock.assert_called_once_with(task_func, a=9, b=3)
+
+
 async def test_run_job_async(app):
     result = []
 
@@ -528,11 +557,7 @@ async def test_wait_for_job_with_job(app, mocker):
 
     wait_for.assert_called_with(test_worker.notify_event.wait.return_value, timeout=42)
 
-    assert test_worker.notify_event.mock_calls == [
-        mocker.call.clear(),
-        mocker.call.wait(),
-        mocker.call.clear(),
-    ]
+    assert test_worker.notify_event.mock_calls == [mocker.call.wait()]
 
 
 async def test_wait_for_job_without_job(app, mocker):
@@ -551,10 +576,7 @@ async def test_wait_for_job_without_job(app, mocker):
 
     wait_for.assert_called_with(test_worker.notify_event.wait.return_value, timeout=42)
 
-    assert test_worker.notify_event.mock_calls == [
-        mocker.call.clear(),
-        mocker.call.wait(),
-    ]
+    assert test_worker.notify_event.mock_calls == [mocker.call.wait()]
 
 
 async def test_single_worker_no_wait(app, mocker):
@@ -614,6 +636,41 @@ async def test_single_worker_stop_during_wait(app, mocker):
     wait_for_job.assert_called_once()
 
 
+async def test_single_worker_notified_during_fetch(app, mocker):
+    process_job = mocker.Mock()
+    event_set_on_wait = []
+
+    class TestWorker(worker.Worker):
+        async def process_job(self, job, worker_id):
+            process_job(job=job)
+
+        async def wait_for_job(self, timeout):
+            assert self.notify_event
+            event_set_on_wait.append(self.notify_event.is_set())
+            self.stop_requested = process_job.called
+
+    test_worker = TestWorker(app=app)
+    test_worker.notify_event = asyncio.Event()
+    await app.job_manager.listen_for_jobs(event=test_worker.notify_event)
+
+    fetch_job = app.job_manager.fetch_job
+
+    async def fetch_and_defer(queues):
+        # A job is deferred right after the fetch came back empty, before the
+        # worker starts waiting
+        job = await fetch_job(queues)
+        if job is None and not process_job.called:
+            await app.configure_task("bla").defer_async()
+        return job
+
+    mocker.patch.object(app.job_manager, "fetch_job", fetch_and_defer)
+
+    await test_worker.single_worker(worker_id=0)
+
+    process_job.assert_called_once()
+    assert event_set_on_wait == [True, False]
+
+
 async def test_single_worker_spread_wait(app, mocker):
     process_job = mocker.Mock()
     wait_for_job = mocker.Mock()